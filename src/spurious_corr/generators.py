@@ -7,15 +7,111 @@ These functions can be used directly or integrated with the ItemInjection modifi
 
 import random
 import calendar
+import functools
 
+from .utils import _load_lines
 
-class SpuriousDateGenerator:
+
+def _shuffle_steps(pool, start, n, rng):
+    """
+    Run n steps of a Fisher-Yates shuffle on pool, beginning at index start.
+
+    Each step swaps a uniformly chosen element of pool[i:] into position i, making the
+    same draws as n single steps taken one call at a time.
+
+    Args:
+        pool (list): The values being shuffled in place.
+        start (int): Index of the first undrawn value.
+        n (int): Number of values to draw.
+        rng (random.Random): Random generator used for the swaps.
+
+    Returns:
+        list: The n drawn values, pool[start:start + n].
+    """
+    randrange = rng.randrange
+    end = len(pool)
+    for i in range(start, start + n):
+        j = randrange(i, end)
+        pool[i], pool[j] = pool[j], pool[i]
+    return pool[start : start + n]
+
+
+@functools.lru_cache(maxsize=1)
+def _all_valid_dates(start_year, end_year):
+    """
+    Precompute all valid dates in the range, once per range.
+
+    The result is cached and shared by every generator built for the same range, so it
+    is returned as an immutable tuple. Only the most recent range is cached, since the
+    default range alone is about 40 MB and the cache outlives the generators.
+
+    Args:
+        start_year (int): First year of the range.
+        end_year (int): Last year of the range (inclusive).
+
+    Returns:
+        tuple[str, ...]: All valid dates in the range, in order.
+    """
+    dates = []
+    for year in range(start_year, end_year + 1):
+        for month in range(1, 13):
+            _, max_day = calendar.monthrange(year, month)
+            for day in range(1, max_day + 1):
+                date_str = f"{year}-{month:02d}-{day:02d}"
+                dates.append(date_str)
+    return tuple(dates)
+
+
+class _UniquePool:
+    """
+    Shared draw-without-replacement logic of the generators.
+
+    Subclasses implement _pool_source, returning a list of the distinct values, and set
+    _exhausted_message to the error raised once all of them have been drawn. The
+    values are copied into a pool on the first draw and shuffled lazily, one
+    Fisher-Yates step per drawn value.
+    """
+
+    _exhausted_message = "All unique values have been generated."
+
+    @property
+    def generated(self):
+        """set: The values drawn so far without replacement."""
+        if self._pool is None:
+            return set()
+        return set(self._pool[: self._num_generated])
+
+    def _draw_unique(self, n):
+        """
+        Draw n values that have not been drawn before.
+
+        Args:
+            n (int): Number of values to draw.
+
+        Returns:
+            list: The n drawn values.
+
+        Raises:
+            RuntimeError: If fewer than n undrawn values remain; nothing is drawn then.
+        """
+        start = self._num_generated
+        if start + n > self.total_possible:
+            raise RuntimeError(self._exhausted_message)
+        if self._pool is None:
+            self._pool = self._pool_source()
+        self._num_generated = start + n
+        return _shuffle_steps(self._pool, start, n, self.rng)
+
+
+class SpuriousDateGenerator(_UniquePool):
     """
     Generates random date strings in YYYY-MM-DD format.
 
     Can be configured to allow or disallow duplicates.
     """
 
+    _exhausted_message = "All unique dates have been generated."
+
     def __init__(self, year_range=(1100, 2600), seed=None, with_replacement=True):
         """
         Initialize the generator.
@@ -27,29 +123,23 @@ class SpuriousDateGenerator:
         """
         self.rng = random.Random(seed)
         self.with_replacement = with_replacement
-        self.generated = set()
-        self.possible_dates = self._generate_all_valid_dates(year_range)
+        self.year_range = tuple(year_range)
+        self.possible_dates = _all_valid_dates(*self.year_range)
         self.total_possible = len(self.possible_dates)
+        # Lazily shuffled copy of the dates and how many of them have been drawn.
+        self._pool = None
+        self._num_generated = 0
 
-    def _generate_all_valid_dates(self, year_range):
-        """
-        Precompute all valid dates in the range.
-
-        Args:
-            year_range (tuple): A (start_year, end_year) tuple.
+    def __getstate__(self):
+        # The dates are rebuilt from year_range on unpickling instead of being
+        # serialized, which keeps copies sent to worker processes small.
+        state = self.__dict__.copy()
+        del state["possible_dates"]
+        return state
 
-        Returns:
-            list[str]: List of all valid dates in the range.
-        """
-        start_year, end_year = year_range
-        dates = []
-        for year in range(start_year, end_year + 1):
-            for month in range(1, 13):
-                _, max_day = calendar.monthrange(year, month)
-                for day in range(1, max_day + 1):
-                    date_str = f"{year}-{month:02d}-{day:02d}"
-                    dates.append(date_str)
-        return dates
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.possible_dates = _all_valid_dates(*self.year_range)
 
     def __call__(self):
         """
@@ -63,24 +153,43 @@ class SpuriousDateGenerator:
         """
         if self.with_replacement:
             return self.rng.choice(self.possible_dates)
+        return self._draw_unique(1)[0]
 
-        if len(self.generated) >= self.total_possible:
-            raise RuntimeError("All unique dates have been generated.")
+    def batch(self, n):
+        """
+        Generate n random date strings in one call.
+
+        With replacement, all n dates are drawn with a single rng.choices call, so the
+        sequence differs from n consecutive calls to the generator. Without replacement,
+        the result matches n consecutive calls, but nothing is drawn if fewer than n
+        unique dates remain.
+
+        Args:
+            n (int): Number of dates to generate.
+
+        Returns:
+            list[str]: A list of n random date strings.
+
+        Raises:
+            RuntimeError: If all unique dates have been generated (when with_replacement is False).
+        """
+        if self.with_replacement:
+            return self.rng.choices(self.possible_dates, k=n)
+        return self._draw_unique(n)
 
-        while True:
-            date = self.rng.choice(self.possible_dates)
-            if date not in self.generated:
-                self.generated.add(date)
-                return date
+    def _pool_source(self):
+        return list(self.possible_dates)
 
 
-class SpuriousFileItemGenerator:
+class SpuriousFileItemGenerator(_UniquePool):
     """
     Generates items from a file, optionally without replacement.
 
     Each non-empty line in the file is considered a distinct item.
     """
 
+    _exhausted_message = "All unique items have been generated."
+
     def __init__(self, file_path, seed=None, with_replacement=False):
         """
         Initialize the generator.
@@ -92,15 +201,19 @@ class SpuriousFileItemGenerator:
         """
         self.rng = random.Random(seed)
         self.with_replacement = with_replacement
-        self.generated = set()
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            self.items = [line.strip() for line in f if line.strip()]
+        self.items = _load_lines(file_path)
 
         if not self.items:
             raise ValueError("File is empty or contains only blank lines.")
 
+        # Without replacement every distinct item is generated exactly once.
         self.total_possible = len(self.items)
+        if not with_replacement:
+            self.total_possible = len(set(self.items))
+        # Lazily shuffled copy of the distinct items and how many have been drawn.
+        self._pool = None
+        self._num_generated = 0
 
     def __call__(self):
         """
@@ -114,12 +227,29 @@ class SpuriousFileItemGenerator:
         """
         if self.with_replacement:
             return self.rng.choice(self.items)
+        return self._draw_unique(1)[0]
 
-        if len(self.generated) >= self.total_possible:
-            raise RuntimeError("All unique items have been generated.")
+    def batch(self, n):
+        """
+        Generate n random items in one call.
+
+        With replacement, all n items are drawn with a single rng.choices call, so the
+        sequence differs from n consecutive calls to the generator. Without replacement,
+        the result matches n consecutive calls, but nothing is drawn if fewer than n
+        unique items remain.
+
+        Args:
+            n (int): Number of items to generate.
+
+        Returns:
+            list[str]: A list of n random items.
+
+        Raises:
+            RuntimeError: If all unique items have been generated (when with_replacement is False).
+        """
+        if self.with_replacement:
+            return self.rng.choices(self.items, k=n)
+        return self._draw_unique(n)
 
-        while True:
-            item = self.rng.choice(self.items)
-            if item not in self.generated:
-                self.generated.add(item)
-                return item
+    def _pool_source(self):
+        return list(dict.fromkeys(self.items))
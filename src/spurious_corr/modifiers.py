@@ -6,8 +6,244 @@ This module defines the base Modifier class, as well as subclasses for injecting
 modifiers (CompositeModifier).
 """
 
+import copy
+import pickle
 import random
-import re
+import string
+import types
+from concurrent.futures import ProcessPoolExecutor
+
+from .utils import _load_lines, _open_lines
+
+# Valid values for the location argument of the injection modifiers.
+_LOCATIONS = frozenset(("beginning", "random", "end"))
+
+# Characters that may start a tag name, e.g. the "b" in "<b>" or "</b>".
+_TAG_NAME_START = frozenset(string.ascii_letters)
+
+
+def _interleave(words, injections, positions):
+    """
+    Merge injections into a token list so that they land at the given output indices.
+
+    Each position is an index in the merged list, of length len(words) +
+    len(injections). When the positions are a sorted uniform sample of distinct
+    indices, the result has the same distribution as inserting each injection at a
+    uniformly random slot of the growing list, but it is built in one pass instead of
+    repeated list.insert calls. Runs of untouched tokens between injections are
+    copied with a single slice each.
+
+    Args:
+        words (list): The original tokens.
+        injections (list): Tokens to inject, in order.
+        positions (list[int]): Sorted, distinct output indices, one per injection.
+
+    Returns:
+        list: A new list containing the original tokens and the injections.
+    """
+    out = []
+    extend = out.extend
+    append = out.append
+    prev = 0
+    for num_injected, (pos, injection) in enumerate(zip(positions, injections)):
+        # Number of original tokens that come before this injection.
+        end = pos - num_injected
+        if end != prev:
+            extend(words[prev:end])
+            prev = end
+        append(injection)
+    extend(words[prev:])
+    return out
+
+
+def _count_tokens(text):
+    """
+    Count the whitespace-separated tokens in text, exactly like len(text.split()).
+
+    Printable ASCII text can only contain plain spaces as whitespace, so when it also
+    has no double spaces the tokens are counted with str.count instead of building the
+    token list. Any other text falls back to str.split.
+
+    Args:
+        text (str): The text to count.
+
+    Returns:
+        int: The number of tokens.
+    """
+    if not text:
+        return 0
+    if text.isascii() and text.isprintable() and "  " not in text:
+        return text.count(" ") + 1 - text.startswith(" ") - text.endswith(" ")
+    return len(text.split())
+
+
+def _is_space_joined(text):
+    """
+    Return True if text is known to equal " ".join(text.split()).
+
+    Only printable ASCII text is checked, using str methods that do not build the
+    token list; any other text returns False.
+
+    Args:
+        text (str): The text to check.
+
+    Returns:
+        bool: Whether re-joining the tokens of text would leave it unchanged.
+    """
+    return (
+        text.isascii()
+        and text.isprintable()
+        and "  " not in text
+        and not text.startswith(" ")
+        and not text.endswith(" ")
+    )
+
+
+def _reseed(obj, rng, seen):
+    """
+    Reseed every random.Random reachable from obj's attributes.
+
+    Used on the copies made by _load_reseeded so that they do not all replay the
+    random stream of the original modifier.
+
+    Args:
+        obj: The object to walk (a modifier, injection source, list of modifiers, ...).
+        rng (random.Random): Generator that supplies the new seeds.
+        seen (set): Ids of objects already visited.
+    """
+    if id(obj) in seen:
+        return
+    seen.add(id(obj))
+
+    if isinstance(obj, random.Random):
+        obj.seed(rng.getrandbits(64))
+        return
+    if isinstance(obj, types.MethodType):
+        children = [obj.__self__]
+    elif isinstance(obj, (list, tuple)):
+        # Skip token lists, which can be large and never hold generators.
+        if obj and isinstance(obj[0], str):
+            return
+        children = obj
+    elif isinstance(
+        obj, (str, bytes, int, float, type, types.FunctionType, types.ModuleType)
+    ):
+        return
+    else:
+        children = list(getattr(obj, "__dict__", {}).values())
+        for cls in type(obj).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(obj, name):
+                    children.append(getattr(obj, name))
+
+    for child in children:
+        _reseed(child, rng, seen)
+
+
+def _reseeded_copy(modifier, seed):
+    """
+    Return an independent copy of modifier with its random.Random instances reseeded.
+
+    Only random.Random instances reachable through attributes are reseeded; other
+    generators, e.g. one captured in a closure or a NumPy generator inside an
+    injection source, are copied with their current state. Modifiers that cannot be
+    pickled, e.g. ones built from a lambda, are copied with deepcopy instead.
+
+    Args:
+        modifier: The modifier to copy.
+        seed (int): Seed for the copy's random generators.
+
+    Returns:
+        A copy of modifier that does not share any state with it.
+    """
+    try:
+        data = pickle.dumps(modifier)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        modifier = copy.deepcopy(modifier)
+        _reseed(modifier, random.Random(seed), set())
+        return modifier
+    return _load_reseeded(data, seed)
+
+
+def _load_reseeded(data, seed):
+    """
+    Unpickle a modifier and reseed its random.Random instances.
+
+    Copying through pickle is much faster than deepcopy for modifiers holding large
+    item lists, and the pickled bytes can be reused for many copies.
+
+    Args:
+        data (bytes): The pickled modifier.
+        seed (int): Seed for the copy's random generators.
+
+    Returns:
+        The unpickled, reseeded modifier.
+    """
+    modifier = pickle.loads(data)
+    _reseed(modifier, random.Random(seed), set())
+    return modifier
+
+
+# The pickled modifier handed to this worker process by CompositeModifier.apply_batch.
+_worker_modifier = None
+
+
+def _init_worker(modifier):
+    """
+    Store the pickled modifier once per worker process, so chunks do not each carry it.
+
+    Args:
+        modifier: The modifier to apply in this worker.
+    """
+    global _worker_modifier
+    _worker_modifier = pickle.dumps(modifier)
+
+
+def _apply_chunk(seed, texts, labels, modifier=None):
+    """
+    Apply a fresh copy of a modifier to one chunk of (text, label) pairs.
+
+    Args:
+        seed (int): Seed for this chunk's random generators.
+        texts (list[str]): Texts in the chunk.
+        labels (list): Labels in the chunk.
+        modifier (optional): The modifier to copy. Defaults to the worker's pickled
+            modifier.
+
+    Returns:
+        list[tuple]: The modified (text, label) pairs.
+    """
+    if modifier is None:
+        modifier = _load_reseeded(_worker_modifier, seed)
+    else:
+        modifier = _reseeded_copy(modifier, seed)
+    return [modifier(text, label) for text, label in zip(texts, labels)]
+
+
+class _RandomChoice:
+    """
+    Injection source that picks uniformly from a fixed list of items.
+
+    Calling the instance returns one item; batch(n) returns n items drawn with a
+    single rng.choices call.
+    """
+
+    __slots__ = ("items", "rng")
+
+    def __init__(self, items, rng):
+        """
+        Args:
+            items (list): Items to choose from.
+            rng (random.Random): Random generator used for sampling.
+        """
+        self.items = items
+        self.rng = rng
+
+    def __call__(self):
+        return self.rng.choice(self.items)
+
+    def batch(self, n):
+        return self.rng.choices(self.items, k=n)
 
 
 class Modifier:
@@ -23,6 +259,8 @@ class Modifier:
                 return transformed_text, transformed_label
     """
 
+    __slots__ = ()
+
     def __call__(self, text: str, label):
         """
         Apply the transformation to a single text-label pair.
@@ -36,6 +274,28 @@ class Modifier:
         """
         raise NotImplementedError("Subclasses must implement __call__")
 
+    def batch_call(self, texts, labels):
+        """
+        Apply the transformation to a batch of text-label pairs.
+
+        The default implementation calls the modifier on each pair in order.
+        Subclasses can override it to amortize per-call overhead across the batch.
+
+        Args:
+            texts (list[str]): The input texts to transform.
+            labels (list): The associated labels, one per text.
+
+        Returns:
+            tuple: (transformed_texts, transformed_labels) as two lists.
+        """
+        new_texts = []
+        new_labels = []
+        for text, label in zip(texts, labels):
+            text, label = self(text, label)
+            new_texts.append(text)
+            new_labels.append(label)
+        return new_texts, new_labels
+
 
 class CompositeModifier:
     """
@@ -45,15 +305,26 @@ class CompositeModifier:
     the combination of various transformations or injections into one composite operation.
     """
 
+    __slots__ = ("modifiers",)
+
     def __init__(self, modifiers: list):
         """
         Initialize a CompositeModifier instance.
 
+        Nested CompositeModifier instances are flattened into their modifiers, so
+        each sample goes through a single loop regardless of nesting.
+
         Args:
             modifiers (list): A list of modifier instances (subclasses of Modifier)
                               to be applied sequentially.
         """
-        self.modifiers = modifiers
+        flat = []
+        for modifier in modifiers:
+            if isinstance(modifier, CompositeModifier):
+                flat.extend(modifier.modifiers)
+            else:
+                flat.append(modifier)
+        self.modifiers = tuple(flat)
 
     def __call__(self, text: str, label):
         """
@@ -70,6 +341,116 @@ class CompositeModifier:
             text, label = modifier(text, label)
         return text, label
 
+    def batch_call(self, texts, labels):
+        """
+        Apply all modifiers in sequence to a batch of (text, label) pairs.
+
+        The whole batch is passed through each modifier in turn, using the modifier's
+        own batch_call when it has one. The result matches calling the composite on
+        each pair, as long as the modifiers do not share a random generator.
+
+        Args:
+            texts (list[str]): The input texts.
+            labels (list): The associated labels, one per text.
+
+        Returns:
+            tuple: (modified_texts, modified_labels) as two lists.
+        """
+        texts = list(texts)
+        labels = list(labels)
+        for modifier in self.modifiers:
+            batch_call = getattr(modifier, "batch_call", None)
+            if batch_call is not None:
+                texts, labels = batch_call(texts, labels)
+            else:
+                pairs = [modifier(text, label) for text, label in zip(texts, labels)]
+                texts = [text for text, _ in pairs]
+                labels = [label for _, label in pairs]
+        return texts, labels
+
+    def iter_apply(self, texts, labels):
+        """
+        Lazily apply all modifiers to a stream of (text, label) pairs.
+
+        Pairs are transformed one at a time as the result is iterated, so large corpora
+        can be processed without holding every modified text in memory.
+
+        Args:
+            texts (iterable[str]): The input texts.
+            labels (iterable): The associated labels, one per text.
+
+        Yields:
+            tuple: The modified (text, label) pair for each input pair.
+        """
+        for text, label in zip(texts, labels):
+            yield self(text, label)
+
+    def iter_file(self, file_path, label=None):
+        """
+        Lazily apply all modifiers to each non-empty line of a text file.
+
+        The file is read line by line while the result is iterated, so it is never
+        loaded into memory as a whole.
+
+        Args:
+            file_path (str): Path to a file with one text per line.
+            label: The label passed along with every line.
+
+        Yields:
+            tuple: The modified (text, label) pair for each non-empty line.
+        """
+        with open(file_path, "r", encoding="utf-8") as file:
+            for line in file:
+                line = line.strip()
+                if line:
+                    yield self(line, label)
+
+    def apply_batch(self, texts, labels, num_workers=None, chunksize=1000, seed=None):
+        """
+        Apply all modifiers to many (text, label) pairs, spreading chunks over processes.
+
+        Each chunk is processed by its own copy of this modifier, with every
+        random.Random instance in the copy reseeded from ``seed``. Chunks therefore do not replay the
+        same random stream, and the result depends only on ``seed`` and ``chunksize``,
+        not on the number of workers, including the serial case. Other generators, e.g.
+        one captured in a closure or a NumPy generator, are not reseeded and replay the
+        same stream in every chunk. Generators sampling without replacement only
+        guarantee uniqueness within a chunk. All modifiers and injection sources must be
+        picklable, e.g. built with from_list, from_file or a generator class.
+
+        Args:
+            texts (list[str]): The input texts.
+            labels (list): The associated labels, one per text.
+            num_workers (int, optional): Number of worker processes. Defaults to the
+                number of CPUs; 0 or 1 applies the modifiers serially in this process.
+            chunksize (int): Number of pairs sent to a worker at once. The modifier
+                is sent to each worker once and copied there for every chunk.
+            seed (int, optional): Seed for the per-chunk random generators.
+
+        Returns:
+            list[tuple]: The modified (text, label) pairs, in input order.
+        """
+        texts = list(texts)
+        labels = list(labels)
+        rng = random.Random(seed)
+        starts = range(0, len(texts), chunksize)
+        seeds = [rng.getrandbits(64) for _ in starts]
+        text_chunks = [texts[i : i + chunksize] for i in starts]
+        label_chunks = [labels[i : i + chunksize] for i in starts]
+
+        if num_workers in (0, 1):
+            return [
+                pair
+                for chunk in zip(seeds, text_chunks, label_chunks)
+                for pair in _apply_chunk(*chunk, modifier=self)
+            ]
+
+        with ProcessPoolExecutor(
+            max_workers=num_workers, initializer=_init_worker, initargs=(self,)
+        ) as executor:
+            results = executor.map(_apply_chunk, seeds, text_chunks, label_chunks)
+            return [pair for chunk in results for pair in chunk]
+
 
 class ItemInjection(Modifier):
     """
@@ -80,6 +461,15 @@ class ItemInjection(Modifier):
     - from_function: Using a custom function to generate injections.
     """
 
+    __slots__ = (
+        "injection_source",
+        "_batch_source",
+        "_location",
+        "token_proportion",
+        "rng",
+        "_inject",
+    )
+
     def __init__(
         self,
         injection_source,
@@ -92,28 +482,50 @@ class ItemInjection(Modifier):
         Initialize an ItemInjection instance.
 
         Args:
-            injection_source (callable): A function that returns an injection token.
+            injection_source (callable): A function that returns an injection token. If it
+                also exposes a batch(n) method returning n tokens, that method is used to
+                draw all injections for a text in one call.
             location (str): Where to inject the token ("beginning", "random", "end").
             token_proportion (float): Proportion of tokens in the text to be injected. Proportion of 0 injects a single token.
             seed (int, optional): Seed for reproducibility.
+
+        Raises:
+            TypeError: If injection_source is not callable.
+            ValueError: If token_proportion or location is out of range.
         """
-        assert callable(injection_source), "injection_source must be callable"
+        if not callable(injection_source):
+            raise TypeError("injection_source must be callable")
         self.injection_source = injection_source
-        self.location = location
+        batch_source = getattr(injection_source, "batch", None)
+        self._batch_source = batch_source if callable(batch_source) else None
         self.token_proportion = token_proportion
         self.rng = _rng or random.Random(seed)
 
-        assert 0 <= token_proportion <= 1, "token_proportion must be between 0 and 1"
-        assert location in {
-            "beginning",
-            "random",
-            "end",
-        }, "location must be 'beginning', 'random', or 'end'"
+        if not 0 <= token_proportion <= 1:
+            raise ValueError("token_proportion must be between 0 and 1")
+        self.location = location
+
+    @property
+    def location(self):
+        """str: Where to inject the token ("beginning", "random", "end")."""
+        return self._location
+
+    @location.setter
+    def location(self, location):
+        if location not in _LOCATIONS:
+            raise ValueError("location must be 'beginning', 'random', or 'end'")
+        self._location = location
+        # Pick the location-specific implementation once instead of on every call. The
+        # plain function is stored, so copies of the modifier do not call back into it.
+        self._inject = getattr(type(self), f"_inject_{location}")
 
     def __call__(self, text: str, label):
         """
         Inject tokens into the text at specified locations.
 
+        The text is split on whitespace and re-joined with single spaces around the
+        injected tokens.
+
         Args:
             text (str): The input text to modify.
             label: The original label (unchanged).
@@ -121,24 +533,64 @@ class ItemInjection(Modifier):
         Returns:
             tuple: The modified text and the original label.
         """
-        words = text.split()
-        num_tokens = len(words)
+        return self._inject(self, text), label
+
+    def batch_call(self, texts, labels):
+        """
+        Inject tokens into a batch of texts in one call.
+
+        The output is the same as calling the modifier on each pair in order, but the
+        location dispatch is looked up once for the whole batch.
 
+        Args:
+            texts (list[str]): The input texts to modify.
+            labels (list): The original labels (unchanged).
+
+        Returns:
+            tuple: (modified_texts, labels) as two lists.
+        """
+        inject = self._inject
+        return [inject(self, text) for text in texts], list(labels)
+
+    def _draw_injections(self, num_tokens):
         # Ensure at least one token is injected
         num_to_inject = max(1, int(num_tokens * self.token_proportion))
 
-        injections = [self.injection_source() for _ in range(num_to_inject)]
+        if self._batch_source is not None:
+            return self._batch_source(num_to_inject)
+        return [self.injection_source() for _ in range(num_to_inject)]
+
+    # When re-joining would not change the text, beginning and end only need the
+    # token count, so they splice the injections on without building the token list.
 
-        if self.location == "beginning":
-            words = injections + words
-        elif self.location == "end":
-            words = words + injections
-        elif self.location == "random":
-            for injection in injections:
-                pos = self.rng.randint(0, len(words))
-                words.insert(pos, injection)
+    def _inject_beginning(self, text):
+        if not _is_space_joined(text):
+            words = text.split()
+            return " ".join([*self._draw_injections(len(words)), *words])
+        injected = " ".join(self._draw_injections(_count_tokens(text)))
+        return f"{injected} {text}" if text else injected
 
-        return " ".join(words), label  # return modified text and unchanged label
+    def _inject_end(self, text):
+        if not _is_space_joined(text):
+            words = text.split()
+            return " ".join([*words, *self._draw_injections(len(words))])
+        injected = " ".join(self._draw_injections(_count_tokens(text)))
+        return f"{text} {injected}" if text else injected
+
+    def _inject_random(self, text):
+        words = text.split()
+        injections = self._draw_injections(len(words))
+
+        # Sample the output indices of all injections in one call and merge in a
+        # single pass, instead of inserting into a growing list.
+        num_injections = len(injections)
+        num_slots = len(words) + num_injections
+        if num_injections == 1:
+            # A single injection lands uniformly in one of the n + 1 output slots.
+            positions = [self.rng.randrange(num_slots)]
+        else:
+            positions = sorted(self.rng.sample(range(num_slots), num_injections))
+        return " ".join(_interleave(words, injections, positions))
 
     @classmethod
     def from_list(
@@ -162,11 +614,8 @@ class ItemInjection(Modifier):
         """
         rng = random.Random(seed)
 
-        def injection_source():
-            return rng.choice(items)
-
         return cls(
-            injection_source,
+            _RandomChoice(items, rng),
             location=location,
             token_proportion=token_proportion,
             seed=seed,
@@ -184,7 +633,9 @@ class ItemInjection(Modifier):
         """
         Create an ItemInjection instance using tokens read from a file.
 
-        Each non-empty line becomes a potential injection item.
+        Each non-empty line becomes a potential injection item. Very large files are
+        memory-mapped and each drawn line is read on demand, instead of holding every
+        line in memory.
 
         Args:
             file_path (str): Path to the file with one token per line.
@@ -195,16 +646,12 @@ class ItemInjection(Modifier):
         Returns:
             ItemInjection: Configured instance.
         """
-        with open(file_path, "r", encoding="utf-8") as file:
-            items = [line.strip() for line in file if line.strip()]
+        items = _open_lines(file_path)
 
         rng = random.Random(seed)
 
-        def injection_source():
-            return rng.choice(items)
-
         return cls(
-            injection_source,
+            _RandomChoice(items, rng),
             location=location,
             token_proportion=token_proportion,
             _rng=rng,
@@ -230,7 +677,8 @@ class ItemInjection(Modifier):
         Returns:
             ItemInjection: Configured instance.
         """
-        assert callable(injection_func), "injection_func must be callable"
+        if not callable(injection_func):
+            raise TypeError("injection_func must be callable")
         return cls(
             injection_func,
             location=location,
@@ -240,6 +688,16 @@ class ItemInjection(Modifier):
 
 
 class HTMLInjection(Modifier):
+    __slots__ = (
+        "tags",
+        "_pairs",
+        "_location",
+        "level",
+        "token_proportion",
+        "rng",
+        "_inject_with_tags",
+    )
+
     def __init__(
         self,
         file_path: str,
@@ -248,15 +706,7 @@ class HTMLInjection(Modifier):
         token_proportion: float = None,
         seed=None,
     ):
-        with open(file_path, "r", encoding="utf-8") as f:
-            self.tags = [line.strip() for line in f if line.strip()]
-        self.location = location
-        self.level = level
-        self.token_proportion = token_proportion
-        self.rng = random.Random(seed)
-
-        if token_proportion is not None:
-            assert 0 < token_proportion <= 1, "token_proportion must be between 0 and 1"
+        self._setup(_load_lines(file_path), location, level, token_proportion, seed)
 
     @classmethod
     def from_file(
@@ -285,16 +735,57 @@ class HTMLInjection(Modifier):
         seed=None,
     ):
         instance = cls.__new__(cls)
-        instance.tags = tags
-        instance.location = location
-        instance.level = level
-        instance.token_proportion = token_proportion
-        instance.rng = random.Random(seed)
+        instance._setup(tags, location, level, token_proportion, seed)
+        return instance
+
+    def _setup(self, tags, location, level, token_proportion, seed):
+        """
+        Validate the arguments and store the state shared by every constructor.
 
+        The tag lines are split into (opening, closing) pairs here, once, so that
+        choosing a tag on each call is a single rng.choice.
+        """
         if token_proportion is not None:
-            assert 0 < token_proportion <= 1, "token_proportion must be between 0 and 1"
+            if not 0 < token_proportion <= 1:
+                raise ValueError("token_proportion must be between 0 and 1")
+        self.location = location
 
-        return instance
+        self.tags = tags
+        self._pairs = self._parse_tags(tags)
+        self.level = level
+        self.token_proportion = token_proportion
+        self.rng = random.Random(seed)
+
+    @property
+    def location(self):
+        """str: Where to inject tags ("beginning", "random", "end")."""
+        return self._location
+
+    @location.setter
+    def location(self, location):
+        if location not in _LOCATIONS:
+            raise ValueError("location must be 'beginning', 'random', or 'end'")
+        self._location = location
+        # Pick the location-specific tag injection function once, at assignment. It
+        # takes (self, tokens, opening, closing) and returns the new token list.
+        self._inject_with_tags = getattr(type(self), f"_inject_with_tags_{location}")
+
+    @staticmethod
+    def _parse_tags(tags):
+        """
+        Split each tag line into an (opening, closing) pair once, up front.
+
+        Args:
+            tags (list[str]): Tag lines, e.g. "<b> </b>" or "<br>".
+
+        Returns:
+            tuple[tuple]: (opening_tag, closing_tag or None) for each line.
+        """
+        pairs = []
+        for line in tags:
+            parts = line.split()
+            pairs.append((parts[0], parts[1] if len(parts) >= 2 else None))
+        return tuple(pairs)
 
     def _choose_tag(self):
         """
@@ -303,64 +794,76 @@ class HTMLInjection(Modifier):
         Returns:
             tuple: (opening_tag, closing_tag or None)
         """
-        line = self.rng.choice(self.tags)
-        parts = line.split()
-        if len(parts) >= 2:
-            return parts[0], parts[1]
-        else:
-            return parts[0], None
+        return self.rng.choice(self._pairs)
 
-    def _inject_into_tokens(self, tokens, location):
-        tokens = tokens[:]
+    def _inject_into_tokens(self, tokens):
         n = len(tokens)
+        inject_with_tags = self._inject_with_tags
 
         if self.token_proportion is None:
             opening, closing = self._choose_tag()
-            return self._inject_with_tags(tokens, opening, closing, location)
+            return inject_with_tags(self, tokens, opening, closing)
 
         # Otherwise, inject up to token_proportion of total tokens
         num_insertions = max(1, int(n * self.token_proportion))
         for _ in range(num_insertions):
             opening, closing = self._choose_tag()
-            tokens = self._inject_with_tags(tokens, opening, closing, location)
+            tokens = inject_with_tags(self, tokens, opening, closing)
         return tokens
 
-    def _inject_with_tags(self, tokens, opening, closing, location):
-        if location == "beginning":
-            new_tokens = [opening] + tokens
-            if closing:
-                pos = self.rng.randint(1, len(new_tokens))
-                new_tokens.insert(pos, closing)
-            return new_tokens
-
-        elif location == "end":
-            new_tokens = tokens[:]
-            pos = self.rng.randint(0, len(new_tokens))
-            new_tokens.insert(pos, opening)
-            if closing:
-                new_tokens.append(closing)
-            return new_tokens
-
-        elif location == "random":
-            new_tokens = tokens[:]
-            pos_open = self.rng.randint(0, len(new_tokens))
-            new_tokens.insert(pos_open, opening)
-            if closing:
-                pos_close = self.rng.randint(pos_open + 1, len(new_tokens))
-                new_tokens.insert(pos_close, closing)
-            return new_tokens
-
-        return tokens
+    # The _inject_with_tags_* methods never modify their input. Positions are drawn
+    # exactly as if the tags were inserted one after the other, then mapped back to
+    # the original tokens so the result is built from slices in a single pass.
+
+    def _inject_with_tags_beginning(self, tokens, opening, closing):
+        if not closing:
+            return [opening, *tokens]
+        pos = self.rng.randint(1, len(tokens) + 1) - 1
+        return [opening, *tokens[:pos], closing, *tokens[pos:]]
+
+    def _inject_with_tags_end(self, tokens, opening, closing):
+        pos = self.rng.randint(0, len(tokens))
+        if not closing:
+            return [*tokens[:pos], opening, *tokens[pos:]]
+        return [*tokens[:pos], opening, *tokens[pos:], closing]
+
+    def _inject_with_tags_random(self, tokens, opening, closing):
+        pos_open = self.rng.randint(0, len(tokens))
+        if not closing:
+            return [*tokens[:pos_open], opening, *tokens[pos_open:]]
+        pos_close = self.rng.randint(pos_open + 1, len(tokens) + 1) - 1
+        return [
+            *tokens[:pos_open],
+            opening,
+            *tokens[pos_open:pos_close],
+            closing,
+            *tokens[pos_close:],
+        ]
+
+    def _inject(self, text):
+        if self.token_proportion is None and self._location == "beginning":
+            opening, closing = self._choose_tag()
+            # A lone opening tag at the beginning needs no position draw, so when
+            # re-joining would not change the text it can be prepended directly.
+            if closing is None and _is_space_joined(text):
+                return f"{opening} {text}" if text else opening
+            tokens = text.split()
+            return " ".join(self._inject_with_tags(self, tokens, opening, closing))
 
-    def _inject(self, text, location):
         tokens = text.split()
-        new_tokens = self._inject_into_tokens(tokens, location)
+        new_tokens = self._inject_into_tokens(tokens)
         return " ".join(new_tokens)
 
-    def _find_level_span(self, text, level):
+    @staticmethod
+    def _find_level_span(text, level):
         """
         Find the first span inside the desired HTML nesting level.
 
+        Tags are located with a single left-to-right str.find scan that only tracks
+        the current nesting depth, instead of matching every tag with a regex and
+        keeping a stack of matches. A tag is "<" or "</" followed by an ASCII letter
+        and ending at the next ">".
+
         Args:
             text (str): Input HTML text.
             level (int): Desired nesting level.
@@ -368,23 +871,33 @@ class HTMLInjection(Modifier):
         Returns:
             tuple or None: (start, end) of the content region, or None if not found.
         """
-        tag_regex = re.compile(r"</?([a-zA-Z][a-zA-Z0-9]*)[^>]*>")
-        stack = []
-        for match in tag_regex.finditer(text):
-            tag_str = match.group(0)
-            tag_name = match.group(1)
-            if not tag_str.startswith("</"):
-                stack.append((tag_name, match.end()))
-            else:
-                if stack:
-                    open_tag, start_index = stack.pop()
-                    if len(stack) == level - 1:
-                        return (start_index, match.start())
+        find = text.find
+        depth = 0
+        span_start = None
+        lt = find("<")
+        while lt >= 0:
+            closing = text.startswith("/", lt + 1)
+            name_start = lt + 2 if closing else lt + 1
+            if text[name_start : name_start + 1] not in _TAG_NAME_START:
+                lt = find("<", lt + 1)
+                continue
+            gt = find(">", name_start + 1)
+            if gt < 0:
+                break
+            if not closing:
+                depth += 1
+                if depth == level:
+                    span_start = gt + 1
+            elif depth:
+                depth -= 1
+                if depth == level - 1:
+                    return (span_start, lt)
+            lt = find("<", gt + 1)
         return None
 
     def __call__(self, text: str, label):
         if self.level is None:
-            return self._inject(text, self.location), label
+            return self._inject(text), label
         elif self.level == 0:
             opening, closing = self._choose_tag()
             if closing:
@@ -394,8 +907,8 @@ class HTMLInjection(Modifier):
         else:
             span = self._find_level_span(text, self.level)
             if span is None:
-                return self._inject(text, self.location), label
+                return self._inject(text), label
             start, end = span
             target = text[start:end]
-            injected = self._inject(target, self.location)
+            injected = self._inject(target)
             return text[:start] + injected + text[end:], label
@@ -7,11 +7,17 @@ to a subset of the dataset based on the provided label and proportion.
 """
 
 import random
-from datasets import concatenate_datasets
+
+from .modifiers import _reseeded_copy
 
 
 def spurious_transform(
-    label_to_modify: int, dataset, modifier, text_proportion: float, seed=None
+    label_to_modify: int,
+    dataset,
+    modifier,
+    text_proportion: float,
+    seed=None,
+    num_proc: int = None,
 ):
     """
     Applies a transformation to a subset of texts in the dataset that have the specified label.
@@ -22,35 +28,81 @@ def spurious_transform(
         modifier: An instance of a Modifier subclass that modifies (text, label).
         text_proportion (float): Proportion of texts to transform using the modifier (between 0 and 1).
         seed (int, optional): Seed for random sampling reproducibility.
+        num_proc (int, optional): Number of processes used by dataset.map. By default the
+            dataset is processed in this process. With several processes, each shard
+            uses its own copy of the modifier with every random.Random instance reseeded
+            from ``seed``, so shards do not replay the same random stream. Other
+            generators, e.g. one captured in a closure, are not reseeded. The output is
+            then reproducible for a given ``seed`` and ``num_proc``, but differs from the
+            serial output, and generators sampling without replacement only guarantee
+            uniqueness within a shard.
 
     Returns:
         Dataset: A new dataset with the transformations applied to examples with the given label.
+            Rows keep their original order. If no example is selected, the input dataset is
+            returned as is.
     """
-    dataset_to_modify = dataset.filter(
-        lambda example: example["label"] == label_to_modify
-    )
-    remaining_dataset = dataset.filter(
-        lambda example: example["label"] != label_to_modify
-    )
+    # Read the label column once to find the rows that carry the target label.
+    matching_indices = [
+        idx for idx, label in enumerate(dataset["label"]) if label == label_to_modify
+    ]
 
     # Determine the exact number of examples to modify
-    n_examples = len(dataset_to_modify)
+    n_examples = len(matching_indices)
     n_to_modify = round(n_examples * text_proportion)
+    if n_to_modify == 0:
+        return dataset
 
     # Create seeded random generator
     rng = random.Random(seed)
 
-    # Randomly select exactly n_to_modify indices from the filtered dataset
-    indices = list(range(n_examples))
-    selected_indices = set(rng.sample(indices, n_to_modify))
+    # Randomly select exactly n_to_modify of the matching examples; when all of them
+    # are modified there is nothing to sample.
+    if n_to_modify == n_examples:
+        selected_indices = set(matching_indices)
+    else:
+        selected_indices = {
+            matching_indices[i] for i in rng.sample(range(n_examples), n_to_modify)
+        }
+    shard_seeds = [rng.getrandbits(64) for _ in range(num_proc or 0)]
+    shard_modifiers = {}
+
+    def modify_batch(texts, labels, indices, rank):
+        # Rows without the target label, or not selected, are passed through as-is.
+        rows = [row for row, idx in enumerate(indices) if idx in selected_indices]
+        if not rows:
+            return {"text": texts, "label": labels}
 
-    def modify_text(example, idx):
-        # Modify only if the current index is in the selected indices
-        if idx in selected_indices:
-            new_text, new_label = modifier(example["text"], example["label"])
-            example["text"] = new_text
-            example["label"] = new_label
-        return example
+        current = modifier
+        if rank is not None:
+            current = shard_modifiers.get(rank)
+            if current is None:
+                current = _reseeded_copy(modifier, shard_seeds[rank])
+                shard_modifiers[rank] = current
 
-    modified_dataset = dataset_to_modify.map(modify_text, with_indices=True)
-    return concatenate_datasets([modified_dataset, remaining_dataset])
+        batch_call = getattr(current, "batch_call", None)
+        if batch_call is not None:
+            new_texts, new_labels = batch_call(
+                [texts[row] for row in rows], [labels[row] for row in rows]
+            )
+        else:
+            new_texts, new_labels = [], []
+            for row in rows:
+                new_text, new_label = current(texts[row], labels[row])
+                new_texts.append(new_text)
+                new_labels.append(new_label)
+
+        for row, new_text, new_label in zip(rows, new_texts, new_labels):
+            texts[row] = new_text
+            labels[row] = new_label
+        return {"text": texts, "label": labels}
+
+    # Only the text and label columns are decoded; any other columns are left as is.
+    return dataset.map(
+        modify_batch,
+        input_columns=["text", "label"],
+        with_indices=True,
+        with_rank=True,
+        batched=True,
+        num_proc=num_proc,
+    )
@@ -3,12 +3,123 @@ utils.py
 
 This module provides utility functions for pretty-printing dataset examples and highlighting
 specific patterns in text. These functions are useful for debugging and visualizing the modifications
-applied to the dataset.
+applied to the dataset. It also holds the shared, cached loader for line-based item files.
 """
 
+import mmap
+import os
 import re
+from array import array
+from itertools import islice
 from termcolor import colored
 
+# Parsed line files keyed by absolute path, stored as (mtime_ns, size, lines).
+_FILE_CACHE = {}
+
+# Files larger than this are memory-mapped by _open_lines instead of being parsed into
+# one string object per line.
+_LAZY_LINES_THRESHOLD = 16 * 1024 * 1024
+
+# YYYY-MM-DD dates, as produced by SpuriousDateGenerator.
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _load_lines(file_path):
+    """
+    Load the stripped, non-empty lines of a file, caching the result per path.
+
+    The cache entry is reused while the file's modification time and size are
+    unchanged, so creating many modifiers or generators from the same file only
+    parses it once.
+
+    Args:
+        file_path (str): Path to the file with one item per line.
+
+    Returns:
+        tuple[str, ...]: The non-empty lines, stripped of surrounding whitespace.
+    """
+    # Key on the absolute path, so a relative path is not confused with another file
+    # of the same name after a change of working directory.
+    key = os.path.abspath(os.fspath(file_path))
+    stat = os.stat(key)
+    cached = _FILE_CACHE.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    with open(key, "r", encoding="utf-8") as file:
+        lines = tuple(line.strip() for line in file.read().split("\n") if line.strip())
+    _FILE_CACHE[key] = (stat.st_mtime_ns, stat.st_size, lines)
+    return lines
+
+
+class _LazyLines:
+    """
+    Read-only sequence of the stripped, non-empty lines of a memory-mapped file.
+
+    Only the byte offsets of the lines are kept in memory; each line is decoded and
+    stripped when it is accessed. Lines are split on "\n", "\r\n" and a lone "\r", like
+    the universal newlines used by _load_lines, so both yield the same items.
+    """
+
+    __slots__ = ("file_path", "_starts", "_ends", "_mm")
+
+    def __init__(self, file_path):
+        """
+        Args:
+            file_path (str): Path to the file with one item per line.
+        """
+        self.file_path = os.fspath(file_path)
+        self._starts = array("q")
+        self._ends = array("q")
+        self._mm = None
+
+        offset = 0
+        with open(self.file_path, "rb") as file:
+            for line in file:
+                # A "\r" byte is always a line break in UTF-8, never part of a character.
+                for part in line.split(b"\r") if b"\r" in line else (line,):
+                    if part.decode("utf-8").strip():
+                        self._starts.append(offset)
+                        self._ends.append(offset + len(part))
+                    offset += len(part) + 1
+                offset -= 1
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        if self._mm is None:
+            with open(self.file_path, "rb") as file:
+                self._mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mm[self._starts[index] : self._ends[index]].decode("utf-8").strip()
+
+    def __getstate__(self):
+        # The map is reopened on first access, e.g. in a worker process.
+        return self.file_path, self._starts, self._ends
+
+    def __setstate__(self, state):
+        self.file_path, self._starts, self._ends = state
+        self._mm = None
+
+
+def _open_lines(file_path):
+    """
+    Return the stripped, non-empty lines of a file as a sequence.
+
+    Files up to _LAZY_LINES_THRESHOLD bytes go through the cached _load_lines. Larger
+    files are indexed once and memory-mapped, so only the lines that are drawn get
+    decoded.
+
+    Args:
+        file_path (str): Path to the file with one item per line.
+
+    Returns:
+        Sequence[str]: The non-empty lines, stripped of surrounding whitespace.
+    """
+    if os.path.getsize(file_path) > _LAZY_LINES_THRESHOLD:
+        return _LazyLines(file_path)
+    return _load_lines(file_path)
+
 
 def pretty_print(text: str, highlight_func=None):
     """
@@ -20,9 +131,11 @@ def pretty_print(text: str, highlight_func=None):
             The function should take a string as input and return a list of substrings to be highlighted.
     """
     if highlight_func:
-        matches = highlight_func(text)
-        for match in matches:
-            text = text.replace(match, colored(match, "green"))
+        # Color every match in one pass; where matches overlap, the longest one wins.
+        matches = sorted({match for match in highlight_func(text) if match}, key=len)
+        if matches:
+            pattern = re.compile("|".join(map(re.escape, reversed(matches))))
+            text = pattern.sub(lambda match: colored(match.group(), "green"), text)
     print(text)
 
 
@@ -37,18 +150,29 @@ def pretty_print_dataset(dataset, n=5, highlight_func=None, label=None):
         highlight_func (callable, optional): Function to identify parts of the text to highlight.
         label (int, optional): If provided, only examples with this label are printed.
     """
-    count = 0
-    for example in dataset:
+    if hasattr(dataset, "select"):
+        if label is not None:
+            # For a Hugging Face dataset, find the matching rows from the label column
+            # alone and fetch just those rows, instead of decoding every example.
+            matching = (
+                idx for idx, value in enumerate(dataset["label"]) if value == label
+            )
+            dataset = dataset.select(list(islice(matching, n)))
+        # Fetch all rows to print with a single slice rather than one at a time.
+        rows = dataset[:n]
+        examples = zip(rows["text"], rows["label"])
+    else:
         # If a label filter is provided, skip examples that do not match.
-        if label is not None and example["label"] != label:
-            continue
-
-        print(f"Text {count + 1} (Label={example['label']}):")
-        pretty_print(example["text"], highlight_func)
+        examples = (
+            (example["text"], example["label"])
+            for example in dataset
+            if label is None or example["label"] == label
+        )
+
+    for count, (text, example_label) in enumerate(islice(examples, n), 1):
+        print(f"Text {count} (Label={example_label}):")
+        pretty_print(text, highlight_func)
         print()
-        count += 1
-        if count >= n:
-            break
 
 
 def highlight_dates(text):
@@ -61,7 +185,7 @@ def highlight_dates(text):
     Returns:
         list: A list of date strings found in the text.
     """
-    return re.findall(r"\d{4}-\d{2}-\d{2}", text)
+    return _DATE_RE.findall(text)
 
 
 def highlight_from_list(patterns):
@@ -75,12 +199,18 @@ def highlight_from_list(patterns):
         callable: A function that takes text and returns a list of matching patterns.
     """
 
+    # Each pattern is searched for once, even if it is listed several times.
+    patterns = tuple(dict.fromkeys(patterns))
+    # A text sharing no character with the pattern starts cannot match any of them.
+    # The empty pattern matches every text, so it disables this precheck.
+    first_chars = None
+    if "" not in patterns:
+        first_chars = frozenset(pattern[0] for pattern in patterns)
+
     def highlight_func(text):
-        matches = []
-        for pattern in patterns:
-            if pattern in text:
-                matches.append(pattern)
-        return matches
+        if first_chars is not None and first_chars.isdisjoint(text):
+            return []
+        return [pattern for pattern in patterns if pattern in text]
 
     return highlight_func
 
@@ -95,9 +225,7 @@ def highlight_from_file(file_path):
     Returns:
         callable: A function that takes text and returns a list of matching patterns.
     """
-    with open(file_path, "r", encoding="utf-8") as file:
-        patterns = [line.strip() for line in file if line.strip()]
-    return highlight_from_list(patterns)
+    return highlight_from_list(_load_lines(file_path))
 
 
 def highlight_html(file_path):
@@ -110,17 +238,5 @@ def highlight_html(file_path):
     Returns:
         callable: A function that takes text and returns a list of matching HTML tags.
     """
-    with open(file_path, "r", encoding="utf-8") as file:
-        patterns = [line.strip() for line in file if line.strip()]
-        tags = []
-        for line in patterns:
-            tags.extend(line.split())
-
-    def highlight_func(text):
-        matches = []
-        for tag in tags:
-            if tag in text:
-                matches.append(tag)
-        return matches
-
-    return highlight_func
+    tags = [tag for line in _load_lines(file_path) for tag in line.split()]
+    return highlight_from_list(tags)
@@ -0,0 +1,50 @@
+import os
+from pathlib import Path
+import pytest
+from datasets import load_dataset
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "slow: needs the IMDB dataset from Hugging Face (deselect with '-m \"not slow\"')",
+    )
+
+
+@pytest.fixture(scope="session")
+def imdb_dataset():
+    """
+    Load the IMDB dataset from Hugging Face once for the whole test session.
+
+    Tests using it are skipped when the Hub cannot be reached and the dataset is not
+    already cached.
+    """
+    try:
+        dataset = load_dataset("imdb")
+    except ConnectionError as e:
+        pytest.skip(f"IMDB dataset unavailable: {e}")
+    train_dataset, test_dataset = dataset["train"], dataset["test"]
+    return train_dataset, test_dataset
+
+
+@pytest.fixture(scope="session")
+def imdb_dataset_small(imdb_dataset):
+    """
+    The first 200 rows of the IMDB train split, sliced from the shared dataset.
+    """
+    train_dataset, _ = imdb_dataset
+    return train_dataset.select(range(200))  # subsample for test speed
+
+
+@pytest.fixture(scope="session")
+def color_list():
+    """
+    Load colors.txt from local data directory once, as a tuple.
+    """
+    data_dir = os.path.join(os.path.dirname(__file__), "data")
+    color_file = os.path.join(data_dir, "colors.txt")
+
+    assert os.path.exists(color_file), f"colors.txt not found at {color_file}"
+
+    lines = Path(color_file).read_text(encoding="utf-8").splitlines()
+    return tuple(line.strip() for line in lines if line.strip())
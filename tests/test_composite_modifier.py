@@ -0,0 +1,111 @@
+from spurious_corr.modifiers import CompositeModifier, HTMLInjection, ItemInjection
+
+
+def make_composite():
+    return CompositeModifier(
+        [
+            ItemInjection.from_list(
+                ["red", "green", "blue"], token_proportion=0.5, seed=1
+            ),
+            HTMLInjection.from_list(["<b> </b>", "<br>"], seed=2),
+        ]
+    )
+
+
+def test_composite_applies_in_sequence():
+    text, label = make_composite()("one two three four", 0)
+    assert label == 0
+    assert any(color in text for color in ["red", "green", "blue"])
+    assert "<b>" in text or "<br>" in text
+
+
+def test_apply_batch_serial_uses_seed():
+    texts = ["alpha beta gamma delta"] * 5
+    labels = list(range(5))
+    composite = make_composite()
+
+    out = composite.apply_batch(texts, labels, num_workers=1, seed=3)
+
+    assert out == composite.apply_batch(texts, labels, num_workers=1, seed=3)
+    assert out != composite.apply_batch(texts, labels, num_workers=1, seed=99)
+    assert [label for _, label in out] == labels
+    # The caller's own generators are not advanced.
+    reference = make_composite()
+    assert composite("alpha beta gamma delta", 0) == reference(
+        "alpha beta gamma delta", 0
+    )
+
+
+def test_apply_batch_serial_matches_workers():
+    texts = ["the same sample text with several tokens to inject into"] * 40
+    labels = [i % 2 for i in range(40)]
+    composite = make_composite()
+
+    out1 = composite.apply_batch(texts, labels, num_workers=1, chunksize=10, seed=3)
+    out2 = composite.apply_batch(texts, labels, num_workers=2, chunksize=10, seed=3)
+
+    assert out1 == out2
+
+
+def test_apply_batch_independent_of_worker_count():
+    texts = ["the same sample text with several tokens to inject into"] * 40
+    labels = [i % 2 for i in range(40)]
+    composite = make_composite()
+
+    out2 = composite.apply_batch(texts, labels, num_workers=2, chunksize=10, seed=3)
+    out3 = composite.apply_batch(texts, labels, num_workers=3, chunksize=10, seed=3)
+
+    assert out2 == out3
+    assert [label for _, label in out2] == labels
+    # Chunks are reseeded, so identical inputs must not replay the same stream.
+    assert out2[:10] != out2[10:20]
+
+
+def test_iter_apply_matches_call():
+    texts = ["alpha beta gamma", "delta epsilon zeta"]
+    labels = [0, 1]
+
+    reference = make_composite()
+    expected = [reference(text, label) for text, label in zip(texts, labels)]
+
+    results = make_composite().iter_apply(texts, labels)
+    assert not isinstance(results, list)
+    assert list(results) == expected
+
+
+def test_iter_file_skips_blank_lines(tmp_path):
+    file_path = tmp_path / "texts.txt"
+    file_path.write_text("first text here\n\nsecond text here\n")
+
+    results = list(make_composite().iter_file(str(file_path), label=1))
+
+    assert len(results) == 2
+    assert all(label == 1 for _, label in results)
+
+
+def test_batch_call_matches_call():
+    texts = ["alpha beta gamma delta", "", "epsilon zeta", "eta theta iota kappa"]
+    labels = [0, 1, 0, 1]
+
+    reference = make_composite()
+    expected = [reference(text, label) for text, label in zip(texts, labels)]
+
+    new_texts, new_labels = make_composite().batch_call(texts, labels)
+    assert list(zip(new_texts, new_labels)) == expected
+
+
+def test_nested_composite_is_flattened():
+    inner = make_composite()
+    item = ItemInjection.from_list(["extra"], seed=4)
+    outer = CompositeModifier([inner, item])
+
+    assert outer.modifiers == (*inner.modifiers, item)
+
+
+def test_apply_batch_serial_accepts_unpicklable_modifiers():
+    composite = CompositeModifier([ItemInjection.from_function(lambda: "X", seed=1)])
+
+    out = composite.apply_batch(["a b c"] * 3, [0, 1, 0], num_workers=1, seed=1)
+
+    assert [label for _, label in out] == [0, 1, 0]
+    assert all(text.split().count("X") == 1 for text, _ in out)
@@ -1,3 +1,4 @@
+import pickle
 import pytest
 from spurious_corr.generators import SpuriousDateGenerator
 
@@ -65,3 +66,61 @@ def test_generator_exhaustion_raises_runtime_error():
 
     with pytest.raises(RuntimeError):
         gen()
+
+
+def test_batch_same_seed_produces_same_sequence():
+    g1 = SpuriousDateGenerator(year_range=(1900, 2100), seed=42)
+    g2 = SpuriousDateGenerator(year_range=(1900, 2100), seed=42)
+
+    dates1 = g1.batch(1000)
+    dates2 = g2.batch(1000)
+
+    assert len(dates1) == 1000
+    assert dates1 == dates2
+
+
+def test_batch_no_replacement_raises_when_exhausted():
+    gen = SpuriousDateGenerator(
+        year_range=(2021, 2021), seed=123, with_replacement=False
+    )
+    dates = gen.batch(365)
+    assert len(set(dates)) == 365
+
+    with pytest.raises(RuntimeError):
+        gen.batch(1)
+
+
+def test_generators_share_date_pool():
+    g1 = SpuriousDateGenerator(year_range=(2000, 2001), seed=1, with_replacement=False)
+    g2 = SpuriousDateGenerator(year_range=(2000, 2001), seed=1, with_replacement=False)
+
+    assert g1.possible_dates is g2.possible_dates
+    assert g1.total_possible == 731
+    # Drawing without replacement must not disturb the shared pool.
+    assert [g1() for _ in range(731)] == [g2() for _ in range(731)]
+    assert list(g1.possible_dates) == sorted(g1.possible_dates)
+
+
+def test_pickle_omits_date_pool():
+    gen = SpuriousDateGenerator(seed=3)
+    gen.batch(5)
+
+    data = pickle.dumps(gen)
+    clone = pickle.loads(data)
+
+    assert len(data) < 10_000
+    assert clone.possible_dates is gen.possible_dates
+    assert [clone() for _ in range(5)] == [gen() for _ in range(5)]
+
+    gen = SpuriousDateGenerator(year_range=(2000, 2000), seed=3, with_replacement=False)
+    gen.batch(5)
+    clone = pickle.loads(pickle.dumps(gen))
+    assert clone.batch(360) == gen.batch(360)
+
+
+def test_generated_tracks_unique_draws():
+    gen = SpuriousDateGenerator(year_range=(2000, 2000), seed=3, with_replacement=False)
+    assert gen.generated == set()
+
+    drawn = [gen() for _ in range(5)] + gen.batch(5)
+    assert gen.generated == set(drawn)
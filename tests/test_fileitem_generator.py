@@ -85,3 +85,47 @@ def test_generator_raises_after_all_items_used(temp_file):
         _ = gen()
     with pytest.raises(RuntimeError, match="All unique items have been generated."):
         gen()
+
+
+def test_batch_with_replacement_reproducible(temp_file):
+    g1 = SpuriousFileItemGenerator(temp_file, seed=42, with_replacement=True)
+    g2 = SpuriousFileItemGenerator(temp_file, seed=42, with_replacement=True)
+
+    items1 = g1.batch(500)
+    items2 = g2.batch(500)
+
+    assert len(items1) == 500
+    assert items1 == items2
+
+
+def test_duplicate_lines_generated_once_without_replacement(tmp_path):
+    file_path = tmp_path / "items.txt"
+    file_path.write_text("a\nb\na\nc\nb\n")
+
+    gen = SpuriousFileItemGenerator(str(file_path), seed=0, with_replacement=False)
+    assert sorted(gen() for _ in range(3)) == ["a", "b", "c"]
+
+    with pytest.raises(RuntimeError, match="All unique items have been generated."):
+        gen()
+
+
+def test_batch_no_replacement_matches_calls(temp_file):
+    g1 = SpuriousFileItemGenerator(temp_file, seed=7, with_replacement=False)
+    g2 = SpuriousFileItemGenerator(temp_file, seed=7, with_replacement=False)
+
+    assert g1.batch(60) == [g2() for _ in range(60)]
+    assert g1() == g2()
+
+    with pytest.raises(RuntimeError, match="All unique items have been generated."):
+        g1.batch(40)
+    assert len(g1.batch(39)) == 39
+
+
+def test_generated_tracks_unique_draws(temp_file):
+    gen = SpuriousFileItemGenerator(temp_file, seed=3, with_replacement=False)
+    assert gen.generated == set()
+
+    drawn = [gen() for _ in range(5)] + gen.batch(5)
+    assert gen.generated == set(drawn)
+    with pytest.raises(AttributeError):
+        gen.generated = set()
@@ -1,6 +1,8 @@
 import pytest
 import tempfile
 import os
+from datasets import Dataset
+from termcolor import colored
 from spurious_corr import utils
 
 
@@ -68,6 +70,15 @@ def test_highlight_html(tmp_path):
     assert sorted(matches) == ["</b>", "</u>", "<b>", "<u>"]
 
 
+def test_highlight_html_reports_shared_tags_once(tmp_path):
+    file_path = tmp_path / "html_tags.txt"
+    file_path.write_text("<br>\n<p> <br>\n")
+
+    highlight_func = utils.highlight_html(file_path)
+
+    assert highlight_func("one<br>two<p>") == ["<br>", "<p>"]
+
+
 def test_highlight_html_none(tmp_path):
     file_content = "<b> </b>\n<i> </i>\n<u> </u>\n"
     file_path = tmp_path / "html_tags.txt"
@@ -81,3 +92,40 @@ def test_highlight_html_none(tmp_path):
     matches = highlight_func(text)
 
     assert matches == []
+
+
+def test_pretty_print_colors_each_match_once(capsys):
+    highlight_func = utils.highlight_from_list(["red", "redwood"])
+    utils.pretty_print("red redwood red", highlight_func)
+
+    red, redwood = colored("red", "green"), colored("redwood", "green")
+    assert capsys.readouterr().out == f"{red} {redwood} {red}\n"
+
+
+def test_pretty_print_dataset_label_filter_matches_rows(capsys):
+    rows = [{"text": f"text {i}", "label": i % 3} for i in range(12)]
+
+    utils.pretty_print_dataset(rows, n=2, label=2)
+    expected = capsys.readouterr().out
+
+    utils.pretty_print_dataset(Dataset.from_list(rows), n=2, label=2)
+    assert capsys.readouterr().out == expected
+    assert "text 2" in expected and "text 5" in expected
+
+
+def test_pretty_print_dataset_slice_matches_rows(capsys):
+    rows = [{"text": f"text {i}", "label": i % 2} for i in range(6)]
+
+    utils.pretty_print_dataset(rows, n=4)
+    expected = capsys.readouterr().out
+
+    utils.pretty_print_dataset(Dataset.from_list(rows), n=4)
+    assert capsys.readouterr().out == expected
+    assert expected.count("Text ") == 4
+
+
+@pytest.mark.parametrize("text", ["", "xyz", "an apple", "pear"])
+def test_highlight_from_list_precheck_matches_scan(text):
+    for patterns in (["apple", "pear"], ["apple", ""]):
+        highlight_func = utils.highlight_from_list(patterns)
+        assert highlight_func(text) == [p for p in patterns if p in text]
@@ -1,6 +1,23 @@
+import copy
 import pytest
+import re
 from spurious_corr.modifiers import HTMLInjection
 
+# Tag grammar of the original regex-based _find_level_span, kept as a reference.
+_TAG_RE = re.compile(r"</?([a-zA-Z][a-zA-Z0-9]*)[^>]*>")
+
+
+def _reference_level_span(text, level):
+    stack = []
+    for match in _TAG_RE.finditer(text):
+        if not match.group(0).startswith("</"):
+            stack.append(match.end())
+        elif stack:
+            start_index = stack.pop()
+            if len(stack) == level - 1:
+                return (start_index, match.start())
+    return None
+
 
 def test_html_injection_proportion(tmp_path):
     # Create a dummy tag file with 3 full tag pairs
@@ -221,3 +238,56 @@ def test_html_injection_level_on_nested_html(tmp_path):
     assert "target" in modified_text
     assert "<x>" in modified_text or "</x>" in modified_text
     assert label == "label"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "<div><span>target text</span></div>",
+        "<a><b>x</b><c>y</c></a><d>z</d>",
+        "<p class='x'>a < b and c > d</p>",
+        "<br/><b>bold</b>",
+        "</b><i>stray close</i>",
+        "< b>not a tag</ b><u>tag</u>",
+        "<1>digits</1><em>ok</em>",
+        "<a>unterminated <b",
+        "no tags at all",
+        "",
+    ],
+)
+def test_find_level_span_matches_tag_regex(text):
+    for level in range(1, 4):
+        assert HTMLInjection._find_level_span(text, level) == _reference_level_span(
+            text, level
+        )
+
+
+def test_html_injection_invalid_location_rejected(tmp_path):
+    tag_path = tmp_path / "tags.txt"
+    tag_path.write_text("<b> </b>\n")
+
+    with pytest.raises(ValueError):
+        HTMLInjection.from_file(str(tag_path), location="middle")
+    with pytest.raises(ValueError):
+        HTMLInjection.from_list(["<b> </b>"], location="middle")
+
+
+@pytest.mark.parametrize("text", ["", "plain text", " padded  text\n", "café au lait"])
+def test_html_injection_beginning_no_closing_matches_rejoin(text):
+    modifier = HTMLInjection.from_list(["<br>"], location="beginning", seed=0)
+    modified_text, _ = modifier(text, "label")
+    assert modified_text == " ".join(["<br>", *text.split()])
+
+
+def test_html_injection_copy_and_location_change_take_effect():
+    modifier = HTMLInjection.from_list(["<br>"], location="end", seed=0)
+
+    clone = copy.copy(modifier)
+    clone.token_proportion = 1.0
+    assert clone("a b c", 0)[0].split().count("<br>") == 3
+    assert modifier("a b c", 0)[0].split().count("<br>") == 1
+
+    modifier.location = "beginning"
+    assert modifier("a b c", 0)[0] == "<br> a b c"
+    with pytest.raises(ValueError):
+        modifier.location = "middle"
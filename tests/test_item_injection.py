@@ -1,33 +1,8 @@
+import copy
 import pytest
-from datasets import load_dataset
 from spurious_corr.generators import SpuriousDateGenerator
 from spurious_corr.generators import SpuriousFileItemGenerator
-from spurious_corr.modifiers import ItemInjection
-import os
-
-
-@pytest.fixture(scope="module")
-def imdb_dataset():
-    """
-    Load IMDB dataset directly using Hugging Face.
-    """
-    dataset = load_dataset("imdb")
-    train_dataset, test_dataset = dataset["train"], dataset["test"]
-    return train_dataset, test_dataset
-
-
-@pytest.fixture(scope="module")
-def color_list():
-    """
-    Load colors.txt from local data directory.
-    """
-    data_dir = os.path.join(os.path.dirname(__file__), "data")
-    color_file = os.path.join(data_dir, "colors.txt")
-
-    assert os.path.exists(color_file), f"colors.txt not found at {color_file}"
-
-    with open(color_file, "r", encoding="utf-8") as f:
-        return [line.strip() for line in f if line.strip()]
+from spurious_corr.modifiers import ItemInjection, _count_tokens, _reseeded_copy
 
 
 def test_injection_proportion():
@@ -72,51 +47,97 @@ def test_injection_location_end():
     assert modified_text.endswith("<Y>")
 
 
-def test_seed_reproducibility(imdb_dataset, color_list):
-    train_dataset, _ = imdb_dataset
+@pytest.mark.parametrize(
+    "text", ["", "hello world", "  hello   world \n\n", "first line\nsecond  line"]
+)
+def test_injection_location_beginning_end_match_rejoin(text):
+    beginning = ItemInjection.from_list(["<W>"], location="beginning", seed=42)
+    end = ItemInjection.from_list(["<W>"], location="end", seed=42)
 
-    for i, example in enumerate(train_dataset):
-        if i >= 500:  # reduce size for test runtime
-            break
+    assert beginning(text, "label")[0] == " ".join(["<W>", *text.split()])
+    assert end(text, "label")[0] == " ".join([*text.split(), "<W>"])
 
-        text = example["text"]
-        label = example["label"]
 
-        mod1 = ItemInjection.from_list(
-            color_list, token_proportion=0.5, location="random", seed=123
-        )
-        mod2 = ItemInjection.from_list(
-            color_list, token_proportion=0.5, location="random", seed=123
+def test_injection_empty_text():
+    modifier = ItemInjection.from_list(["<V>"], location="end", seed=42)
+    modified_text, _ = modifier("", "label")
+    assert modified_text == "<V>"
+
+
+def test_invalid_arguments_raise():
+    with pytest.raises(ValueError):
+        ItemInjection.from_list(["X"], location="middle")
+    with pytest.raises(ValueError):
+        ItemInjection.from_list(["X"], token_proportion=1.5)
+    with pytest.raises(TypeError):
+        ItemInjection.from_function("not callable")
+
+
+def test_injection_location_random_distribution():
+    # Inserting two tokens one at a time into a growing list makes all six
+    # arrangements of "a b" with two "X" equally likely.
+    counts = {}
+    for seed in range(6000):
+        modifier = ItemInjection.from_list(
+            ["X"], token_proportion=1.0, location="random", seed=seed
         )
+        modified_text, _ = modifier("a b", "label")
+        counts[modified_text] = counts.get(modified_text, 0) + 1
 
-        text1, label1 = mod1(text, label)
-        text2, label2 = mod2(text, label)
+    assert len(counts) == 6
+    for count in counts.values():
+        assert abs(count / 6000 - 1 / 6) < 0.03
 
-        assert text1 == text2
-        assert label1 == label2
 
-    date_generator_1 = SpuriousDateGenerator(seed=541, with_replacement=False)
-    date_generator_2 = SpuriousDateGenerator(seed=541, with_replacement=False)
+def test_injection_location_random_single_token_distribution():
+    counts = [0, 0, 0]
+    for seed in range(3000):
+        modifier = ItemInjection.from_list(["X"], location="random", seed=seed)
+        modified_text, _ = modifier("a b", "label")
+        counts[modified_text.split().index("X")] += 1
 
-    for i, example in enumerate(train_dataset):
-        if i >= 500:
-            break
+    for count in counts:
+        assert abs(count / 3000 - 1 / 3) < 0.03
 
-        text = example["text"]
-        label = example["label"]
 
-        mod1 = ItemInjection.from_function(
-            date_generator_1, token_proportion=0.45, location="random", seed=541
-        )
-        mod2 = ItemInjection.from_function(
-            date_generator_2, token_proportion=0.45, location="random", seed=541
-        )
+def test_injection_location_random_preserves_order():
+    text = "one two three four five six seven eight nine ten"
+    modifier = ItemInjection.from_list(
+        ["<Z>"], token_proportion=0.5, location="random", seed=7
+    )
+    modified_text, _ = modifier(text, "label")
+    tokens = modified_text.split()
 
-        text1, label1 = mod1(text, label)
-        text2, label2 = mod2(text, label)
+    assert tokens.count("<Z>") == 5
+    assert [t for t in tokens if t != "<Z>"] == text.split()
 
-        assert text1 == text2
-        assert label1 == label2
+
+@pytest.mark.slow
+def test_seed_reproducibility(imdb_dataset, color_list):
+    train_dataset, _ = imdb_dataset
+    subset = train_dataset.select(range(500))  # reduce size for test runtime
+    texts, labels = list(subset["text"]), list(subset["label"])
+
+    mod1 = ItemInjection.from_list(
+        color_list, token_proportion=0.5, location="random", seed=123
+    )
+    mod2 = ItemInjection.from_list(
+        color_list, token_proportion=0.5, location="random", seed=123
+    )
+
+    assert mod1.batch_call(texts, labels) == mod2.batch_call(texts, labels)
+
+    date_generator_1 = SpuriousDateGenerator(seed=541, with_replacement=False)
+    date_generator_2 = SpuriousDateGenerator(seed=541, with_replacement=False)
+
+    mod1 = ItemInjection.from_function(
+        date_generator_1, token_proportion=0.45, location="random", seed=541
+    )
+    mod2 = ItemInjection.from_function(
+        date_generator_2, token_proportion=0.45, location="random", seed=541
+    )
+
+    assert mod1.batch_call(texts, labels) == mod2.batch_call(texts, labels)
 
 
 def test_different_seeds_yield_different_results():
@@ -128,30 +149,89 @@ def test_different_seeds_yield_different_results():
         ["<A>"], token_proportion=0.5, location="random", seed=2
     )
 
-    text1, _ = mod1(text, "label")
-    text2, _ = mod2(text, "label")
+    texts1 = [mod1(text, "label")[0] for _ in range(3)]
+    texts2 = [mod2(text, "label")[0] for _ in range(3)]
 
-    assert text1 != text2
+    assert texts1 != texts2
 
 
-def test_spurious_file_item_generator(color_list):
+def test_spurious_file_item_generator(color_list, tmp_path):
     """
     Full end-to-end test for SpuriousFileItemGenerator inside ItemInjection.from_function
     """
     # simulate the generator directly from list instead of file
-    import tempfile
-
-    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as f:
-        f.write("\n".join(color_list))
-        file_path = f.name
+    file_path = tmp_path / "colors.txt"
+    file_path.write_text("\n".join(color_list), encoding="utf-8")
 
     generator1 = SpuriousFileItemGenerator(file_path, seed=42, with_replacement=False)
     generator2 = SpuriousFileItemGenerator(file_path, seed=42, with_replacement=False)
 
     # test reproducibility
-    items1 = [generator1() for _ in range(len(color_list))]
-    items2 = [generator2() for _ in range(len(color_list))]
+    items1 = generator1.batch(len(color_list))
+    items2 = generator2.batch(len(color_list))
 
     assert items1 == items2
 
-    os.remove(file_path)
+
+def test_batch_call_matches_call():
+    texts = ["one two three four five six", "", "seven eight", "nine"]
+    labels = ["a", "b", "c", "d"]
+    for location in ["beginning", "random", "end"]:
+        mod1 = ItemInjection.from_list(
+            ["<A>", "<B>"], token_proportion=0.5, location=location, seed=3
+        )
+        mod2 = ItemInjection.from_list(
+            ["<A>", "<B>"], token_proportion=0.5, location=location, seed=3
+        )
+
+        expected = [mod1(text, label) for text, label in zip(texts, labels)]
+        new_texts, new_labels = mod2.batch_call(texts, labels)
+
+        assert list(zip(new_texts, new_labels)) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", " ", "one", " one two ", "one  two", "one\ttwo\nthree", "café au lait"],
+)
+def test_count_tokens_matches_split(text):
+    assert _count_tokens(text) == len(text.split())
+
+
+def test_copy_and_location_change_take_effect():
+    modifier = ItemInjection.from_list(["X"], location="end", seed=0)
+
+    clone = copy.copy(modifier)
+    clone.token_proportion = 1.0
+    assert clone("a b c", 0)[0] == "a b c X X X"
+    assert modifier("a b c", 0)[0] == "a b c X"
+
+    modifier.location = "beginning"
+    assert modifier("a b c", 0)[0] == "X a b c"
+    with pytest.raises(ValueError):
+        modifier.location = "middle"
+
+
+def test_reseeded_copy_is_independent():
+    picklable = ItemInjection.from_list(["X", "Y", "Z"], token_proportion=1.0, seed=1)
+    unpicklable = ItemInjection.from_function(lambda: "X", seed=1)
+
+    for modifier in (picklable, unpicklable):
+        state = modifier.rng.getstate()
+        first = _reseeded_copy(modifier, 7)
+        second = _reseeded_copy(modifier, 7)
+
+        assert first is not modifier and first.rng is not modifier.rng
+        assert modifier.rng.getstate() == state
+        assert first("a b c d e f", 0) == second("a b c d e f", 0)
+
+
+def test_non_callable_batch_attribute_is_ignored():
+    class Source:
+        batch = 32
+
+        def __call__(self):
+            return "X"
+
+    modifier = ItemInjection.from_function(Source(), location="end", seed=0)
+    assert modifier("a b c", 0) == ("a b c X", 0)
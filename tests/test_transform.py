@@ -1,67 +1,58 @@
+import logging
 import pytest
-from datasets import load_dataset
+from datasets import Dataset
 from spurious_corr.generators import SpuriousDateGenerator, SpuriousFileItemGenerator
 from spurious_corr.modifiers import ItemInjection
 from spurious_corr.transform import spurious_transform
-import os
+
+log = logging.getLogger(__name__)
 
 
 @pytest.fixture(scope="module")
-def imdb_dataset():
+def original_columns(imdb_dataset_small):
     """
-    Load IMDB dataset directly from Hugging Face.
+    The original text and label columns, read once for all proportions.
     """
-    dataset = load_dataset("imdb")
-    train_dataset = dataset["train"].select(range(200))  # subsample for test speed
-    return train_dataset
+    return list(imdb_dataset_small["text"]), list(imdb_dataset_small["label"])
 
 
-@pytest.fixture(scope="module")
-def color_list():
-    """
-    Load colors.txt from local data directory.
-    """
-    data_dir = os.path.join(os.path.dirname(__file__), "data")
-    color_file = os.path.join(data_dir, "colors.txt")
+@pytest.mark.slow
+@pytest.mark.parametrize("text_proportion", [0.0, 0.1, 0.25, 0.5, 0.75, 1.0])
+def test_spurious_transform_proportion(
+    imdb_dataset_small, original_columns, color_list, text_proportion
+):
+    label_to_modify = 1
+    modifier = ItemInjection.from_list(color_list, token_proportion=0.5, seed=23)
+    orig_texts, orig_labels = original_columns
+    total_to_modify = orig_labels.count(label_to_modify)
+
+    transformed = spurious_transform(
+        label_to_modify=label_to_modify,
+        dataset=imdb_dataset_small,
+        modifier=modifier,
+        text_proportion=text_proportion,
+        seed=42,
+    )
 
-    assert os.path.exists(color_file), f"colors.txt not found at {color_file}"
+    modified_count = sum(
+        label == label_to_modify and orig != mod
+        for label, orig, mod in zip(orig_labels, orig_texts, transformed["text"])
+    )
+    expected = round(total_to_modify * text_proportion)
 
-    with open(color_file, "r", encoding="utf-8") as f:
-        return [line.strip() for line in f if line.strip()]
+    log.debug(
+        "[text_proportion=%s] Modified: %s / Expected: %s",
+        text_proportion,
+        modified_count,
+        expected,
+    )
+    assert (
+        modified_count == expected
+    ), f"Expected {expected}, but got {modified_count} at proportion {text_proportion}"
 
 
-def test_spurious_transform_proportion_multiple(imdb_dataset, color_list):
-    label_to_modify = 1
-    modifier = ItemInjection.from_list(color_list, token_proportion=0.5, seed=23)
-    originals = [ex for ex in imdb_dataset]
-
-    for text_proportion in [0.0, 0.1, 0.25, 0.5, 0.75, 1.0]:
-        transformed = spurious_transform(
-            label_to_modify=label_to_modify,
-            dataset=imdb_dataset,
-            modifier=modifier,
-            text_proportion=text_proportion,
-            seed=42,
-        )
-
-        modified_count = sum(
-            1
-            for orig, mod in zip(originals, transformed)
-            if orig["label"] == label_to_modify and orig["text"] != mod["text"]
-        )
-
-        total_to_modify = sum(1 for ex in originals if ex["label"] == label_to_modify)
-        expected = round(total_to_modify * text_proportion)
-
-        print(
-            f"[text_proportion={text_proportion}] Modified: {modified_count} / Expected: {expected}"
-        )
-        assert (
-            modified_count == expected
-        ), f"Expected {expected}, but got {modified_count} at proportion {text_proportion}"
-
-
-def test_spurious_transform_reproducible(imdb_dataset):
+@pytest.mark.slow
+def test_spurious_transform_reproducible(imdb_dataset_small):
     date_generator_1 = SpuriousDateGenerator(seed=19, with_replacement=False)
     modifier_1 = ItemInjection.from_function(
         date_generator_1, token_proportion=0.5, seed=19
@@ -72,16 +63,17 @@ def test_spurious_transform_reproducible(imdb_dataset):
         date_generator_2, token_proportion=0.5, seed=19
     )
 
-    transformed1 = spurious_transform(0, imdb_dataset, modifier_1, 0.3, seed=19)
-    transformed2 = spurious_transform(0, imdb_dataset, modifier_2, 0.3, seed=19)
+    transformed1 = spurious_transform(0, imdb_dataset_small, modifier_1, 0.3, seed=19)
+    transformed2 = spurious_transform(0, imdb_dataset_small, modifier_2, 0.3, seed=19)
 
-    texts1 = [ex["text"] for ex in transformed1]
-    texts2 = [ex["text"] for ex in transformed2]
+    texts1 = list(transformed1["text"])
+    texts2 = list(transformed2["text"])
 
     assert texts1 == texts2, "Expected reproducible output with same seed"
 
 
-def test_spurious_transform_different_seeds(imdb_dataset):
+@pytest.mark.slow
+def test_spurious_transform_different_seeds(imdb_dataset_small):
     date_generator_1 = SpuriousDateGenerator(seed=19, with_replacement=False)
     modifier_1 = ItemInjection.from_function(
         date_generator_1, token_proportion=0.5, seed=19
@@ -92,10 +84,51 @@ def test_spurious_transform_different_seeds(imdb_dataset):
         date_generator_2, token_proportion=0.5, seed=19
     )
 
-    transformed1 = spurious_transform(0, imdb_dataset, modifier_1, 0.3, seed=19)
-    transformed2 = spurious_transform(0, imdb_dataset, modifier_2, 0.3, seed=20)
+    transformed1 = spurious_transform(0, imdb_dataset_small, modifier_1, 0.3, seed=19)
+    transformed2 = spurious_transform(0, imdb_dataset_small, modifier_2, 0.3, seed=20)
 
-    texts1 = [ex["text"] for ex in transformed1]
-    texts2 = [ex["text"] for ex in transformed2]
+    texts1 = list(transformed1["text"])
+    texts2 = list(transformed2["text"])
 
     assert texts1 != texts2, "Expected different outputs with different seeds"
+
+
+def test_spurious_transform_keeps_row_order():
+    dataset = Dataset.from_dict(
+        {
+            "text": [f"sample number {i}" for i in range(20)],
+            "label": [i % 2 for i in range(20)],
+        }
+    )
+    modifier = ItemInjection.from_list(["<X>"], location="end", seed=3)
+
+    transformed = spurious_transform(1, dataset, modifier, 0.5, seed=5)
+
+    assert transformed["label"] == dataset["label"]
+    changed = [
+        i
+        for i, (orig, new) in enumerate(zip(dataset["text"], transformed["text"]))
+        if orig != new
+    ]
+    assert len(changed) == 5
+    assert all(dataset["label"][i] == 1 for i in changed)
+    assert all(transformed["text"][i] == f"sample number {i} <X>" for i in changed)
+
+
+def test_spurious_transform_num_proc_reproducible():
+    dataset = Dataset.from_dict({"text": ["same text here"] * 40, "label": [1] * 40})
+    modifier = ItemInjection.from_list(["X", "Y", "Z"], token_proportion=1.0, seed=3)
+
+    texts1 = spurious_transform(1, dataset, modifier, 1.0, seed=7, num_proc=2)["text"]
+    texts2 = spurious_transform(1, dataset, modifier, 1.0, seed=7, num_proc=2)["text"]
+
+    assert list(texts1) == list(texts2)
+    # Each shard reseeds its modifier copy, so the shards do not repeat each other.
+    assert list(texts1[:20]) != list(texts1[20:])
+
+
+def test_spurious_transform_zero_proportion_returns_input():
+    dataset = Dataset.from_dict({"text": ["a b", "c d"], "label": [0, 1]})
+    modifier = ItemInjection.from_list(["<X>"], seed=3)
+
+    assert spurious_transform(1, dataset, modifier, 0.0, seed=5) is dataset
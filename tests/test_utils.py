@@ -0,0 +1,49 @@
+import os
+import pickle
+from spurious_corr import utils
+from spurious_corr.modifiers import ItemInjection
+
+
+def test_load_lines_cached_until_file_changes(tmp_path):
+    file_path = tmp_path / "items.txt"
+    file_path.write_text("alpha\n\n  beta \n")
+
+    first = utils._load_lines(file_path)
+    assert first == ("alpha", "beta")
+    assert utils._load_lines(str(file_path)) is first
+
+    file_path.write_text("alpha\nbeta\ngamma\n")
+    assert utils._load_lines(file_path) == ("alpha", "beta", "gamma")
+
+
+def test_load_lines_cache_resolves_relative_paths(tmp_path, monkeypatch):
+    first_dir, second_dir = tmp_path / "first", tmp_path / "second"
+    first_dir.mkdir()
+    second_dir.mkdir()
+    (first_dir / "items.txt").write_text("alpha\n")
+    (second_dir / "items.txt").write_text("gamma\n")
+    mtime = (first_dir / "items.txt").stat().st_mtime_ns
+    os.utime(second_dir / "items.txt", ns=(mtime, mtime))
+
+    monkeypatch.chdir(first_dir)
+    assert utils._load_lines("items.txt") == ("alpha",)
+    monkeypatch.chdir(second_dir)
+    assert utils._load_lines("items.txt") == ("gamma",)
+
+
+def test_lazy_lines_match_load_lines(tmp_path, monkeypatch):
+    file_path = tmp_path / "items.txt"
+    file_path.write_bytes("alpha\n\n  beta \r\ngamma\rdelta\r\r\n \ndéjà vu".encode())
+
+    lazy = utils._LazyLines(file_path)
+    assert list(lazy) == ["alpha", "beta", "gamma", "delta", "déjà vu"]
+    assert list(lazy) == list(utils._load_lines(file_path))
+    assert list(pickle.loads(pickle.dumps(lazy))) == list(lazy)
+
+    eager = ItemInjection.from_file(file_path, token_proportion=1.0, seed=5)
+    monkeypatch.setattr(utils, "_LAZY_LINES_THRESHOLD", 0)
+    mapped = ItemInjection.from_file(file_path, token_proportion=1.0, seed=5)
+    assert isinstance(mapped.injection_source.items, utils._LazyLines)
+
+    text = "one two three four five"
+    assert mapped(text, 0) == eager(text, 0)